@@ -3,11 +3,14 @@ Command line interface for the fixkit framework.
 """
 
 import argparse
+import logging
 import os
 import sys
 from pathlib import Path
 from typing import Sequence, IO
 
+from fixkit.logger import LOG_FORMAT
+
 
 def parse_args(args: Sequence[str]) -> argparse.Namespace:
     """
@@ -92,4 +95,6 @@ def main(*args: Sequence[str], stdout: IO = sys.stdout, stderr: IO = sys.stderr)
     if stderr is not None:
         sys.stderr = stderr
 
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
     args = parse_args(args)
@@ -14,6 +14,8 @@ class Weighted(abc.ABC):
     An abstract class to represent a weighted object.
     """
 
+    __slots__ = ("weight",)
+
     def __init__(self, weight: float):
         """
         Initialize the weighted object.
@@ -77,6 +79,8 @@ class WeightedIdentifier(Weighted):
     A class to represent a weighted location in the source code based on a statement defined by the identifier.
     """
 
+    __slots__ = ("identifier",)
+
     def __init__(self, identifier: int, weight: float):
         """
         Initialize the weighted identifier.
@@ -1,6 +1,9 @@
 from abc import ABC
 import abc
 from typing import List
+
+import numpy as np
+
 from fixkit.localization.location import WeightedIdentifier
 
 class LocationModifier(ABC):
@@ -8,6 +11,8 @@ class LocationModifier(ABC):
     Modifies the suggestions from localization to only use certain locations 
     or apply a specific mutation chance.
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def locations(self, suggestions: List[WeightedIdentifier]) -> List[WeightedIdentifier]:
         pass
@@ -22,6 +27,8 @@ class DefaultModifier(LocationModifier):
     Does not change the original implementation of genetic repair.
     All suggestions are used for mutations with the weights as the mutation chance.
     """
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -37,6 +44,8 @@ class TopRankModifier(LocationModifier):
     Only considers the first "top_k" locations to mutate.
     Applies an equal mutation chance of 1.0 to all locations.
     """
+    __slots__ = ("top_k",)
+
     def __init__(self, top_k: int = 3):
         self.top_k = top_k
 
@@ -51,15 +60,16 @@ class TopEqualRankModifier(LocationModifier):
     Only considers the locations to mutate, which are under the first "top_k" weights
     and above the fitness threshold. Applies an equal mutation chance of 1.0 to all locations.
     """
+    __slots__ = ("top_k", "threshold")
+
     def __init__(self, top_k: int = 3, threshold: float = 0.0):
         self.top_k = top_k
         self.threshold = threshold
 
     def locations(self, suggestions: List[WeightedIdentifier]) -> List[WeightedIdentifier]:
-        top_weights = []
+        top_weights = set()
         for suggestion in suggestions:
-            if suggestion.weight not in top_weights:
-                top_weights.append(suggestion.weight)
+            top_weights.add(suggestion.weight)
             if len(top_weights) >= self.top_k:
                 break
 
@@ -76,21 +86,32 @@ class SigmoidModifier(LocationModifier):
     to alter the weight. Values above the midpoint are pushed closer to 1.0,
     while values below the midpoint are pushed to 0.0.
     """
+    __slots__ = ("steepness", "midpoint")
+
     def __init__(self, steepness: int = 10, midpoint: int = 0.8):
+        if not 0 < midpoint < 1:
+            raise ValueError(f"The midpoint must lie strictly between 0 and 1, got {midpoint}.")
         self.steepness = steepness
         self.midpoint = midpoint
 
     def locations(self, suggestions: List[WeightedIdentifier]) -> List[WeightedIdentifier]:
+        # SBFL metrics yield few distinct scores, so the curve is only evaluated once per unique weight.
+        unique_weights, inverse = np.unique(
+            np.asarray([location.weight for location in suggestions], dtype=np.float64),
+            return_inverse=True,
+        )
+        weights = self._sigmoid_function(unique_weights)[inverse]
         return [
-            WeightedIdentifier(location.identifier, self._sigmoid_function(location.weight)) 
-            for location in suggestions
+            WeightedIdentifier(location.identifier, float(weight)) 
+            for location, weight in zip(suggestions, weights)
         ]
     
-    def _sigmoid_function(self, weight: float) -> float:
-        x = weight
+    def _sigmoid_function(self, weights: np.ndarray) -> np.ndarray:
+        x = weights
         a = self.steepness
         m = self.midpoint
-        return ((x / m) ** a) / ((x / m) ** a + ((1 - x) / (1 - m)) ** a)
+        numerator = (x / m) ** a
+        return numerator / (numerator + ((1 - x) / (1 - m)) ** a)
     
     def mutation_chance(self, location: WeightedIdentifier) -> float:
         return location.weight
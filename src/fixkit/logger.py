@@ -1,10 +1,10 @@
 import logging
 
+LOG_FORMAT = "%(name)s :: %(levelname)-8s :: %(message)s"
+
+# Handlers and levels are left to the application, see cli.main.
 LOGGER = logging.getLogger("fixkit")
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s :: %(levelname)-8s :: %(message)s",
-)
+LOGGER.addHandler(logging.NullHandler())
 
 
 def deactivate_logger():
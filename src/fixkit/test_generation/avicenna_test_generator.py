@@ -1,19 +1,19 @@
+import logging
 import os
+import pickle
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import TYPE_CHECKING, Dict, List, Set, Optional, Callable, Tuple, Union
 
 from fixkit.constants import DEFAULT_WORK_DIR
-from fixkit.test_generation.test_generator import TestGenerator
+from fixkit.test_generation.test_generator import TestGenerator, _OracleCache, _seeded
 from fixkit.logger import LOGGER
 
-from avicenna.core import Grammar
-from avicenna.data import OracleResult
-from avicenna import Avicenna
-from avicenna.runner.report import SingleFailureReport
-from avicenna.diagnostic import Candidate
-
-from isla.solver import ISLaSolver, _DEFAULTS
-from isla.language import ISLaUnparser, Formula, parse_isla
+# avicenna and isla pull in z3 and are slow to import, so they are imported where they are used.
+if TYPE_CHECKING:
+    from avicenna.core import Grammar
+    from avicenna.diagnostic import Candidate
+    from isla.language import Formula
+    from isla.solver import ISLaSolver
 
 
 
@@ -22,13 +22,15 @@ class AvicennaTestGenerator(TestGenerator):
     def __init__(
         self,
         oracle: Callable,
-        grammar: Grammar,
+        grammar: "Grammar",
         initial_inputs: List[str],
         max_iterations: int,
         out: Optional[os.PathLike] = None,
         saving_method: Optional[str] = None,
         save_automatically: Optional[bool] = True,
         identifier: Optional[str] = None,
+        cache_oracle: Optional[bool] = False,
+        skip_known_inputs: Optional[bool] = False,
     ):
         """
         Initialize the test generator
@@ -38,19 +40,30 @@ class AvicennaTestGenerator(TestGenerator):
         :param List[str] initial_inputs: The initial inputs required to run Avicenna, at least one passing and one failing one.
         :param int max_iterations: The number of iterations.
         :param Optional[os.PathLike] out: The path location for saving labeled inputs.
-        :param Optional[str] saving_method: Use "json" to save inputs inside json files or "files" separate text files for each input.
+        :param Optional[str] saving_method: Use "json" to save inputs inside json files, "files" separate text files for each input, "archive" a single tar archive or "concat" the text files passing.txt and failing.txt of concatenated inputs.
         :param Optional[bool] save_automatically:  If true, test cases are automatically saved after running. Alternatively, use save_test_cases() with a given path. 
         :param Optional[str] identifier: Is used for saving and loading formulas generated through avicenna.
+        :param Optional[bool] cache_oracle: If true, oracle results of solved inputs are persisted in the out directory and reused across sessions.
+        :param Optional[bool] skip_known_inputs: If true, solved inputs are recorded in the out directory and inputs from earlier sessions are skipped.
         """
+        from avicenna import Avicenna
+        from avicenna.data import OracleResult
+        from avicenna.runner.report import SingleFailureReport
+
         super().__init__(
             out=Path(out or DEFAULT_WORK_DIR, "avicenna"),
             saving_method=saving_method,
-            save_automatically=save_automatically
+            save_automatically=save_automatically,
+            cache_oracle=cache_oracle,
+            skip_known_inputs=skip_known_inputs,
             )
 
         self.oracle = oracle
         self.grammar = grammar
-        self.initial_inputs = initial_inputs
+        seen = set()
+        self.initial_inputs = [inp for inp in initial_inputs if not (inp in seen or seen.add(inp))]
+        if len(self.initial_inputs) < len(initial_inputs):
+            LOGGER.info(f"Dropped {len(initial_inputs) - len(self.initial_inputs)} duplicate initial inputs.")
         self.max_iterations = max_iterations
         self.identifier = identifier or "formula"
 
@@ -65,11 +78,18 @@ class AvicennaTestGenerator(TestGenerator):
         self.failing = []    
         self.passing = []
         self.diagnoses = None
+        self._parsed_formulas: Dict[Tuple[str, int], "Formula"] = {}
+        self._seen_inputs: Set[str] = set()
+        if self.cache_oracle:
+            self.oracle_cache = _OracleCache(self.out / "oracle_cache.json", OracleResult)
 
     def _save_formula(self) -> str:
         """
         Saves formula after running avicenna. Can be found under self.out / "formulas" / self.identifier.
+        If the formula can be pickled, the formula object is also saved as self.identifier + ".pkl".
         """
+        from isla.language import ISLaUnparser
+
         dir = Path(self.out) / "formulas"
         dir.mkdir(parents=True, exist_ok=True)
         file_path = dir / self.identifier
@@ -77,8 +97,21 @@ class AvicennaTestGenerator(TestGenerator):
         formula = self.diagnoses[0].formula     
         formula_string = ISLaUnparser(formula).unparse()
 
-        with file_path.open("w") as f:
-            f.write(formula_string)
+        with open(file_path, "wb", buffering=1 << 20) as f:
+            f.write(formula_string.encode())
+
+        # Formulas holding z3 expressions cannot be pickled, these are only cached as text.
+        # The pickle is a best-effort cache, so any failure to create it must not abort the run.
+        # A pickle left by an earlier run under the same identifier is removed, so it cannot be loaded instead.
+        pickle_path = dir / f"{self.identifier}.pkl"
+        try:
+            data = pickle.dumps(formula)
+        except Exception as e:
+            LOGGER.debug(f"Formula {self.identifier} cannot be pickled, only saved as text: {e!r}")
+            pickle_path.unlink(missing_ok=True)
+        else:
+            with open(pickle_path, "wb", buffering=1 << 20) as f:
+                f.write(data)
         
         return file_path
 
@@ -92,19 +125,39 @@ class AvicennaTestGenerator(TestGenerator):
             LOGGER.info(f"No cached formula found at {dir}")
             return None
 
-        with file_path.open("r") as f:
-            formula = f.read()
+        return file_path.read_bytes().decode()
+
+    def load_formula_pickle(self, identifier: str) -> Optional["Formula"]:
+        """
+        Loads the pickled formula from self.out / "formulas" / identifier + ".pkl".
+        The returned formula can be passed to solve_formula without parsing it again.
+        """
+        dir = Path(self.out) / "formulas"
+        file_path = dir / f"{identifier}.pkl"
+        if not file_path.exists():
+            LOGGER.info(f"No pickled formula found at {dir}")
+            return None
 
-        return formula
+        return pickle.loads(file_path.read_bytes())
     
+    @_seeded
     def run(self, save_inputs: bool = True):
         """
         Executes Avicenna with given parameters and saves results in out directory.
         """
-        self.diagnoses: List[Candidate] = self.avicenna.explain()
-
-        failing = self.avicenna.report.get_all_failing_inputs()
-        passing = self.avicenna.report.get_all_passing_inputs()
+        self.diagnoses: List["Candidate"] = self.avicenna.explain()
+
+        # Stringify once, Input.__str__ traverses the derivation tree.
+        seen_failing = set()
+        failing = [
+            inp for inp in map(str, self.avicenna.report.get_all_failing_inputs())
+            if not (inp in seen_failing or seen_failing.add(inp))
+        ]
+        seen_passing = set()
+        passing = [
+            inp for inp in map(str, self.avicenna.report.get_all_passing_inputs())
+            if not (inp in seen_passing or seen_passing.add(inp))
+        ]
 
         file_path = self._save_formula()
         
@@ -112,23 +165,56 @@ class AvicennaTestGenerator(TestGenerator):
         LOGGER.info(f"Avicenna generated {len(failing)} failing and {len(passing)} passing inputs.")
 
         if save_inputs:
-            self.failing = failing
-            self.passing = passing
-            self._save_inputs()
+            self._store_session_inputs(passing, failing)
+            self._seen_inputs = set(self.failing) | set(self.passing)
+
+    def _parse_formula(self, formula: str) -> "Formula":
+        """
+        Parses the formula for the grammar of this TestGenerator. Parsed formulas are memoized,
+        so repeated calls of solve_formula with the same formula skip parsing.
+        """
+        from isla.language import parse_isla
+        from isla.solver import _DEFAULTS
 
+        key = (formula, id(self.grammar))
+        if key not in self._parsed_formulas:
+            self._parsed_formulas[key] = parse_isla(
+                formula, self.grammar, _DEFAULTS.structural_predicates, _DEFAULTS.semantic_predicates
+            )
+        return self._parsed_formulas[key]
+
+    def _new_solver(self, formula: "Formula", optimized_queries: bool) -> "ISLaSolver":
+        """
+        Creates an ISLaSolver for the grammar of this TestGenerator and the given formula.
+        """
+        from isla.solver import ISLaSolver
+
+        return ISLaSolver(
+            grammar = self.grammar,
+            formula = formula,
+            enable_optimized_z3_queries = optimized_queries)
+
+    @_seeded
     def solve_formula(
         self, 
         max_iterations: int, 
         negate_formula: bool = False,
-        formula: Formula = None,
+        formula: Optional[Union[str, "Formula"]] = None,
         only_unique_inputs: bool = False,
         optimized_queries: bool = False
     ):
         """
         Solves formula for more inputs. If no formula is specified, takes diagnosis from last run of this TestGenerator.
+        With only_unique_inputs, inputs already collected by this TestGenerator are skipped as well.
+        The formula can be given as a string or as an already parsed Formula, e.g. from load_formula_pickle().
         """
-        if formula:
-            failure_formula = parse_isla(formula, self.grammar, _DEFAULTS.structural_predicates, _DEFAULTS.semantic_predicates)
+        from avicenna.data import OracleResult
+        from isla.language import Formula
+
+        if isinstance(formula, Formula):
+            failure_formula = formula
+        elif formula:
+            failure_formula = self._parse_formula(formula)
         elif self.diagnoses:
             failure_formula = self.diagnoses[0].formula      
         else:
@@ -138,11 +224,11 @@ class AvicennaTestGenerator(TestGenerator):
         passing: List[str] = []
         failing: List[str] = []
         undefined: List[str] = []
+        seen = self._seen_inputs
 
-        solver = ISLaSolver(
-            grammar = self.grammar,
-            formula = -failure_formula if negate_formula else failure_formula,
-            enable_optimized_z3_queries = optimized_queries)       
+        # Negate once, restarts only need a fresh solver for the same formula.
+        effective_formula = -failure_formula if negate_formula else failure_formula
+        solver = self._new_solver(effective_formula, optimized_queries)
         
         i = 0
         isla_restart = 0
@@ -150,45 +236,54 @@ class AvicennaTestGenerator(TestGenerator):
         while i < max_iterations and isla_restart < 100:
             try:      
                 inp = solver.solve()            
-                oracle_result, _ = self.oracle(inp)
 
                 if fail_safe >= 50:
                     fail_safe = 0
                     raise StopIteration
 
-                if (only_unique_inputs and (str(inp) in passing or str(inp) in failing)):
+                s = str(inp)
+                if only_unique_inputs and s in seen:
                     fail_safe += 1
                     continue
 
+                if self.input_index is not None and s in self.input_index:
+                    fail_safe += 1
+                    continue
+
+                oracle_result = self._label(inp, s)
                 if oracle_result == OracleResult.PASSING:
-                    passing.append(str(inp))
+                    passing.append(s)
+                    seen.add(s)
                 elif oracle_result == OracleResult.FAILING:
-                    failing.append(str(inp))
+                    failing.append(s)
+                    seen.add(s)
                 else:
-                    undefined.append(str(inp))
+                    undefined.append(s)
                     fail_safe += 1
                     continue
 
+                if self.input_index is not None:
+                    self.input_index.add(s)
+
                 i += 1
-                if i % 10 == 0:
-                    LOGGER.info(f"ISLaSolver generated {len(failing)} failing and {len(passing)} passing inputs so far.")
+                if LOGGER.isEnabledFor(logging.INFO) and i % 10 == 0:
+                    LOGGER.info(
+                        "ISLaSolver generated %d failing and %d passing inputs so far.", 
+                        len(failing), len(passing)
+                    )
 
             except StopIteration:
 
                 isla_restart += 1 
-                if isla_restart % 10 == 0:
-                    LOGGER.info(f"ISLaSolver was restarted {isla_restart} times (max 100). Generated {len(failing)} failing and {len(passing)} passing inputs so far.")
+                if LOGGER.isEnabledFor(logging.INFO) and isla_restart % 10 == 0:
+                    LOGGER.info(
+                        "ISLaSolver was restarted %d times (max 100). Generated %d failing and %d passing inputs so far.", 
+                        isla_restart, len(failing), len(passing)
+                    )
 
-                solver = ISLaSolver(
-                    grammar = self.grammar,
-                    formula = -failure_formula if negate_formula else failure_formula,
-                    enable_optimized_z3_queries = optimized_queries)       
+                solver = self._new_solver(effective_formula, optimized_queries)
                 continue
 
-        if only_unique_inputs:
-            passing = list(set(passing))
-            failing = list(set(failing))
-
         self.passing.extend(passing)
         self.failing.extend(failing)
 
@@ -1,21 +1,22 @@
+import logging
 import os
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import TYPE_CHECKING, List, Set, Optional, Callable
 
-from fixkit.test_generation.test_generator import TestGenerator
+from fixkit.test_generation.test_generator import TestGenerator, _OracleCache, _seeded
 from fixkit.constants import DEFAULT_WORK_DIR
 from fixkit.logger import LOGGER
 
-from debugging_framework.input.oracle import OracleResult
-from isla.fuzzer import Grammar
-from isla.fuzzer import GrammarFuzzer
+# isla pulls in z3 and is slow to import, so it is imported where it is used.
+if TYPE_CHECKING:
+    from isla.fuzzer import Grammar
 
 class GrammarFuzzerTestGenerator(TestGenerator):
 
     def __init__(
         self,
         oracle: Callable,
-        grammar: Grammar,
+        grammar: "Grammar",
         num_failing: int,
         num_passing: int,
         max_iterations: int = 20000,
@@ -23,6 +24,8 @@ class GrammarFuzzerTestGenerator(TestGenerator):
         out: Optional[os.PathLike] = None,
         saving_method: Optional[str] = None,
         save_automatically: Optional[bool] = True,
+        cache_oracle: Optional[bool] = False,
+        skip_known_inputs: Optional[bool] = False,
     ):
         """
         Initialize the test generator
@@ -32,15 +35,20 @@ class GrammarFuzzerTestGenerator(TestGenerator):
         :param int num_passing: The number of passing test cases the fuzzer aims to generate.
         :param int generation_limit: The max number of iterations the fuzzer will perform. Use it as a fail-safe.
         :param Optional[os.PathLike] out: The path location for saving labeled inputs.
-        :param Optional[str] saving_method: Use "json" to save inputs inside json files or "files" separate text files for each input.
+        :param Optional[str] saving_method: Use "json" to save inputs inside json files, "files" separate text files for each input, "archive" a single tar archive or "concat" the text files passing.txt and failing.txt of concatenated inputs.
         :param Optional[bool] save_automatically: If true, test cases are automatically saved after running. Alternatively, use save_test_cases() with a given path. 
+        :param Optional[bool] cache_oracle: If true, oracle results are persisted in the out directory and reused across sessions.
+        :param Optional[bool] skip_known_inputs: If true, generated inputs are recorded in the out directory and inputs from earlier sessions are skipped.
         """
+        from debugging_framework.input.oracle import OracleResult
 
         super().__init__(
             seed=seed,
             out=Path(out or DEFAULT_WORK_DIR, "grammar_fuzzer"),
             saving_method=saving_method,
-            save_automatically=save_automatically
+            save_automatically=save_automatically,
+            cache_oracle=cache_oracle,
+            skip_known_inputs=skip_known_inputs,
             )
 
         self.oracle = oracle
@@ -51,16 +59,24 @@ class GrammarFuzzerTestGenerator(TestGenerator):
 
         self.failing = []    
         self.passing = []
+        if self.cache_oracle:
+            self.oracle_cache = _OracleCache(self.out / "oracle_cache.json", OracleResult)
     
+    @_seeded
     def run(self):
         """
         Execute GrammarFuzzer with parameter and save results in out directory.
         """
+        from debugging_framework.input.oracle import OracleResult
+        from isla.fuzzer import GrammarFuzzer
+
         passing_count = 0
         failing_count = 0
 
         failing_inputs: List[str] = []
         passing_inputs: List[str] = []
+        failing_seen: Set[str] = set()
+        passing_seen: Set[str] = set()
 
         fuzzer = GrammarFuzzer(self.grammar)
         iteration = 0
@@ -68,24 +84,37 @@ class GrammarFuzzerTestGenerator(TestGenerator):
         while iteration < self.max_iterations:
 
             inp = fuzzer.fuzz()
-            oracle_result, _ = self.oracle(inp)
             iteration += 1
 
-            if iteration % 10 == 0:
-                LOGGER.info(f"Found {len(failing_inputs)} failing and {len(passing_inputs)} passing inputs in {iteration} iterations")
+            if LOGGER.isEnabledFor(logging.INFO) and iteration % 10 == 0:
+                LOGGER.info(
+                    "Found %d failing and %d passing inputs in %d iterations", 
+                    len(failing_inputs), len(passing_inputs), iteration
+                )
+
+            if self.input_index is not None and inp in self.input_index:
+                continue
 
-            if oracle_result == OracleResult.FAILING and inp not in failing_inputs:
+            oracle_result = self._label(inp, inp)
+
+            if oracle_result == OracleResult.FAILING and inp not in failing_seen:
                 if failing_count >= self.num_failing:
                     continue
 
+                failing_seen.add(inp)
                 failing_inputs.append(inp)
+                if self.input_index is not None:
+                    self.input_index.add(inp)
                 failing_count += 1
 
-            elif oracle_result == OracleResult.PASSING and inp not in passing_inputs:
+            elif oracle_result == OracleResult.PASSING and inp not in passing_seen:
                 if passing_count >= self.num_passing:
                     continue
 
+                passing_seen.add(inp)
                 passing_inputs.append(inp)
+                if self.input_index is not None:
+                    self.input_index.add(inp)
                 passing_count += 1
 
             if failing_count >= self.num_failing and passing_count >= self.num_passing:
@@ -93,7 +122,4 @@ class GrammarFuzzerTestGenerator(TestGenerator):
 
         LOGGER.info(f"Grammar fuzzer found {len(failing_inputs)} failing and {len(passing_inputs)} passing inputs in {iteration} iterations.")
 
-        self.passing = passing_inputs
-        self.failing = failing_inputs
-
-        self._save_inputs()
\ No newline at end of file
+        self._store_session_inputs(passing_inputs, failing_inputs)
\ No newline at end of file
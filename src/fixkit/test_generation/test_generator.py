@@ -1,14 +1,220 @@
 import abc
 from abc import ABC
+import functools
 import os
+import io
 import json
+import hashlib
+import mmap
+import re
+import tarfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
 from fixkit.constants import DEFAULT_WORK_DIR
 import shutil
 from fixkit.logger import LOGGER
 import random
-import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Separates the inputs in passing.txt and failing.txt of the "concat" saving method.
+# Input lines consisting only of dashes are escaped with one more dash, so the separator never occurs in an input.
+CONCAT_SEPARATOR = "\n---\n"
+_DASH_LINE = re.compile(r"^(-{3,})$", re.MULTILINE)
+_ESCAPED_DASH_LINE = re.compile(r"^-(-{3,})$", re.MULTILINE)
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serializes obj to json bytes, using orjson if it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Deserializes json bytes, using orjson if it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _seeded(method: Callable) -> Callable:
+    """
+    Runs a TestGenerator method with the generator's own random state installed in the global
+    random and numpy.random modules, which the underlying fuzzers and solvers draw from.
+    The previous global state is restored afterwards, the generator's state continues on the next call.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "TestGenerator", *args, **kwargs):
+        import numpy as np
+
+        if self.np_rng is None:
+            self.np_rng = np.random.RandomState(self.seed)
+        random_state, np_state = random.getstate(), np.random.get_state()
+        random.setstate(self.rng.getstate())
+        np.random.set_state(self.np_rng.get_state())
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.rng.setstate(random.getstate())
+            self.np_rng.set_state(np.random.get_state())
+            random.setstate(random_state)
+            np.random.set_state(np_state)
+
+    return wrapper
+
+
+def _write_bytes(path: Path, data: bytes):
+    """
+    Writes the data to the path with raw file descriptor calls, skipping the buffered file object.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_files(files: List[Tuple[Path, str]]):
+    """
+    Writes each text to its path. Small file writes are bound by file system latency
+    rather than CPU, so they are overlapped in a thread pool.
+    """
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(lambda file: _write_bytes(file[0], file[1].encode()), files))
+
+
+def _remove_discarded(parent: Path, name: str):
+    for old in parent.glob(f".{name}.old-*"):
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def _discard_directory(dir: Path):
+    """
+    Moves the directory out of the way with a single rename and deletes it in a background thread,
+    so callers can recreate it immediately. Leftovers of interrupted deletions are removed as well.
+    """
+    os.replace(dir, dir.with_name(f".{dir.name}.old-{uuid.uuid4().hex}"))
+    threading.Thread(target=_remove_discarded, args=(dir.parent, dir.name), daemon=True).start()
+
+
+class _OracleCache:
+    """
+    Persistent mapping from inputs to oracle results, stored as a single json file.
+    Inputs are keyed by the BLAKE2b digest of their string representation.
+    """
+
+    def __init__(self, path: os.PathLike, result_type: Type[Enum]):
+        """
+        Initialize the oracle cache.
+        :param os.PathLike path: The json file backing the cache.
+        :param Type[Enum] result_type: The oracle result enum used to restore cached labels.
+        """
+        self.path = Path(path)
+        self.result_type = result_type
+        self._results: Optional[Dict[str, str]] = None
+        self._dirty = False
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def _load(self) -> Dict[str, str]:
+        if self._results is None:
+            self._results = {}
+            if self.path.is_file():
+                self._results = _loads(self.path.read_bytes())
+        return self._results
+
+    def get(self, text: str) -> Optional[Enum]:
+        """
+        Returns the cached oracle result for the input string or None on a miss.
+        """
+        name = self._load().get(self._key(text))
+        return None if name is None else self.result_type[name]
+
+    def put(self, text: str, result: Enum):
+        """
+        Stores the oracle result for the input string. Written to disk on flush().
+        """
+        self._load()[self._key(text)] = result.name
+        self._dirty = True
+
+    def flush(self):
+        """
+        Writes the cache to disk if it changed since the last flush.
+        """
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb", buffering=1 << 20) as f:
+            f.write(_dumps(self._results))
+        self._dirty = False
+
+
+class _InputIndex:
+    """
+    Persistent set of inputs generated in earlier sessions.
+    Inputs are stored as fixed-width BLAKE2b digests of their string representation in a binary file.
+    """
+
+    DIGEST_SIZE = 16
+
+    def __init__(self, path: os.PathLike):
+        """
+        Initialize the input index and load the digests already stored in the file.
+        :param os.PathLike path: The binary file backing the index.
+        """
+        self.path = Path(path)
+        self._known: Set[bytes] = set()
+        self._pending: List[bytes] = []
+        if self.path.is_file() and self.path.stat().st_size > 0:
+            with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                end = len(m) - len(m) % self.DIGEST_SIZE
+                self._known = {m[i:i + self.DIGEST_SIZE] for i in range(0, end, self.DIGEST_SIZE)}
+
+    @classmethod
+    def _digest(cls, text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=cls.DIGEST_SIZE).digest()
+
+    def __contains__(self, text: str) -> bool:
+        return self._digest(text) in self._known
+
+    def add(self, text: str):
+        """
+        Adds the input string to the index. Written to disk on flush().
+        """
+        digest = self._digest(text)
+        if digest not in self._known:
+            self._known.add(digest)
+            self._pending.append(digest)
+
+    def flush(self):
+        """
+        Appends the digests added since the last flush to the file.
+        """
+        if not self._pending:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as f:
+            f.write(b"".join(self._pending))
+        self._pending = []
+
 
 class TestGenerator(ABC):
 
@@ -17,29 +223,44 @@ class TestGenerator(ABC):
         seed: int = 0,
         out: Optional[os.PathLike] = None,
         saving_method: Optional[str] = None,
-        save_automatically: Optional[bool] = True
+        save_automatically: Optional[bool] = True,
+        cache_oracle: Optional[bool] = False,
+        skip_known_inputs: Optional[bool] = False,
     ):
         """
         Initialize the test generator
+        :param int seed: The seed for the random state used while generating inputs.
         :param Optional[os.PathLike] out: The path location for saving labeled inputs.
-        :param Optional[str] saving_method: Saves passing and failing test cases in json files or separate text files.
+        :param Optional[str] saving_method: Saves passing and failing test cases in json files, separate text files, a single tar archive or two text files of concatenated inputs.
         :param Optional[bool] save_automatically: If true, test cases are automatically saved after running. Alternatively, use save_test_cases() with a given path. 
+        :param Optional[bool] cache_oracle: If true, oracle results are persisted under out / "oracle_cache.json" and reused across sessions.
+        :param Optional[bool] skip_known_inputs: If true, generated inputs are recorded under out / "input_hashes.bin" and inputs from earlier sessions are skipped.
+        The test cases saved by earlier sessions are then kept and extended.
         """
 
         self.seed = seed
-        random.seed(seed)
-        np.random.seed(seed)
+        self.rng = random.Random(seed)
+        self.np_rng = None
         self.out = Path(out or DEFAULT_WORK_DIR)
 
         self.saving_method = saving_method or "files" 
-        if self.saving_method not in ["json", "files"]:
-            raise ValueError('Invalid argument. Use either "json" or "files".')
+        if self.saving_method not in ["json", "files", "archive", "concat"]:
+            raise ValueError('Invalid argument. Use either "json", "files", "archive" or "concat".')
 
         self.save_automatically = save_automatically
 
         self.failing = None
         self.passing = None
         self.saving_path = Path(self.out, "test_cases")
+        self._persisted_passing = 0
+        self._persisted_failing = 0
+        self.cache_oracle = cache_oracle
+        self.oracle_cache: Optional[_OracleCache] = None
+        self._labels: Dict[str, Enum] = {}
+        self.skip_known_inputs = skip_known_inputs
+        self.input_index: Optional[_InputIndex] = (
+            _InputIndex(self.out / "input_hashes.bin") if skip_known_inputs else None
+        )
     
     @abc.abstractmethod
     def run(self):
@@ -48,88 +269,232 @@ class TestGenerator(ABC):
         """
         pass
 
-    def _save_inputs(self):
+    def _label(self, inp: Any, text: Optional[str] = None) -> Enum:
+        """
+        Labels the input with self.oracle. Labels are memoized by the string representation of the input,
+        in the persistent oracle cache if enabled and in memory for the lifetime of the generator otherwise.
+        :param Any inp: The input passed to the oracle.
+        :param Optional[str] text: The string representation of inp, if already computed by the caller.
+        """
+        if text is None:
+            text = str(inp)
+
+        if self.oracle_cache is None:
+            oracle_result = self._labels.get(text)
+            if oracle_result is None:
+                oracle_result, _ = self.oracle(inp)
+                self._labels[text] = oracle_result
+            return oracle_result
+
+        oracle_result = self.oracle_cache.get(text)
+        if oracle_result is None:
+            oracle_result, _ = self.oracle(inp)
+            self.oracle_cache.put(text, oracle_result)
+        return oracle_result
+
+    def _save_inputs(self, overwrite: bool = False):
+        """
+        Saves self.passing and self.failing with the chosen saving method.
+        :param bool overwrite: If true, previously saved test cases are removed first. Otherwise, only
+        inputs appended since the last save are written where the saving method allows it.
+        """
+        if self.oracle_cache is not None:
+            self.oracle_cache.flush()
+        if self.input_index is not None:
+            self.input_index.flush()
+
         if not self.save_automatically:
             return
 
         if self.saving_method == "json":
-            self._save_as_json()
+            self._save_as_json(overwrite)
         elif self.saving_method == "files":
-            self._save_as_files()
+            self._save_as_files(overwrite)
+        elif self.saving_method == "archive":
+            self._save_as_archive(overwrite)
+        elif self.saving_method == "concat":
+            self._save_as_concat(overwrite)
 
         LOGGER.info(f"Saved {len(self.failing) + len(self.passing)} test cases under {self.out}")
 
+    def _store_session_inputs(self, passing: List[Any], failing: List[Any]):
+        """
+        Stores the inputs generated in this session as self.passing and self.failing and saves them.
+        If known inputs are skipped, the test cases saved by earlier sessions are kept and extended instead
+        of replaced, since they are not generated again. All stored inputs are recorded in the input index,
+        including those of generators that do not consult the index while generating.
+        """
+        if self.input_index is None:
+            self.passing = passing
+            self.failing = failing
+            self._save_inputs(overwrite=True)
+            return
+
+        saved_passing, saved_failing = self._load_saved_inputs()
+        known = set(saved_passing) | set(saved_failing)
+        self.passing = saved_passing + [inp for inp in passing if str(inp) not in known]
+        self.failing = saved_failing + [inp for inp in failing if str(inp) not in known]
+        for inp in self.passing + self.failing:
+            self.input_index.add(str(inp))
+        self._persisted_passing = len(saved_passing)
+        self._persisted_failing = len(saved_failing)
+        self._save_inputs()
+
+    def _load_saved_inputs(self) -> Tuple[List[str], List[str]]:
+        """
+        Loads the passing and failing test cases saved under self.saving_path with the chosen saving method.
+        """
+        dir = self.saving_path
+        if self.saving_method == "json":
+            return self.load_passing_tests(dir), self.load_failing_tests(dir)
+        elif self.saving_method == "files":
+            return self._load_from_files(dir, "passing"), self._load_from_files(dir, "failing")
+        elif self.saving_method == "archive":
+            return self.load_passing_tests_from_archive(dir), self.load_failing_tests_from_archive(dir)
+        return self.load_passing_tests_from_concat(dir), self.load_failing_tests_from_concat(dir)
+
+
+    def _prepare_saving_path(self, overwrite: bool) -> Path:
+        """
+        Creates the saving directory. It is cleared if overwrite is set or nothing was saved before,
+        so that stale test cases from earlier sessions do not remain.
+        """
+        dir = self.saving_path
+        if overwrite or (self._persisted_passing == 0 and self._persisted_failing == 0):
+            if dir.exists():
+                _discard_directory(dir)
+            self._persisted_passing = 0
+            self._persisted_failing = 0
+        dir.mkdir(parents=True, exist_ok=True)
+        return dir
 
-    def _save_as_files(self):
+    def _save_as_files(self, overwrite: bool = False):
         """
         Saves each input from self.passing and self.failing as separate text files.
+        Only inputs added since the last save are written, unless overwrite is set.
         Files are saved in the output directory as:
         - passing_test_X.txt
         - failing_test_X.txt
         """
 
-        dir = self.out / "test_cases"
-        if dir.exists():
-            shutil.rmtree(dir)
-        dir.mkdir(parents=True, exist_ok=True)
+        dir = self._prepare_saving_path(overwrite)
+        _write_files(
+            [(dir / f"passing_test_{idx}", str(self.passing[idx])) 
+             for idx in range(self._persisted_passing, len(self.passing))]
+            + [(dir / f"failing_test_{idx}", str(self.failing[idx])) 
+               for idx in range(self._persisted_failing, len(self.failing))]
+        )
+
+        self._persisted_passing = len(self.passing)
+        self._persisted_failing = len(self.failing)
 
-        for idx, test in enumerate(self.passing):
-            passing_file_path = dir / f"passing_test_{idx}"
-            with passing_file_path.open("w") as f:
-                f.write(str(test))
 
-        for idx, test in enumerate(self.failing):
-            failing_file_path = dir / f"failing_test_{idx}"
-            with failing_file_path.open("w") as f:
-                f.write(str(test))
+    def _archive_inputs(self, filepath: os.PathLike, mode: str, passing_start: int = 0, failing_start: int = 0):
+        """
+        Writes the inputs of self.passing and self.failing from the given start indices into a tar archive.
+        :param os.PathLike filepath: The path of the archive.
+        :param str mode: "w" to create a new archive or "a" to append to an existing one.
+        """
+        with tarfile.open(filepath, mode) as tf:
+            for prefix, tests, start in (
+                ("passing", self.passing, passing_start), 
+                ("failing", self.failing, failing_start),
+            ):
+                for idx in range(start, len(tests)):
+                    data = str(tests[idx]).encode()
+                    info = tarfile.TarInfo(name=f"{prefix}_test_{idx}")
+                    info.size = len(data)
+                    tf.addfile(info, io.BytesIO(data))
+
+    def _save_as_archive(self, overwrite: bool = False):
+        """
+        Saves all inputs from self.passing and self.failing in a single tar archive.
+        Inputs added since the last save are appended, unless overwrite is set.
+        The archive is saved in the output directory as tests.tar with the members:
+        - passing_test_X
+        - failing_test_X
+        """
 
+        dir = self._prepare_saving_path(overwrite)
+        self._archive_inputs(dir / "tests.tar", "a", self._persisted_passing, self._persisted_failing)
 
-    def _save_as_json(self):
+        self._persisted_passing = len(self.passing)
+        self._persisted_failing = len(self.failing)
+
+
+    def _save_as_concat(self, overwrite: bool = False):
         """
-        Saves inputs in json files.
+        Saves all inputs from self.passing and self.failing in the two text files passing.txt and failing.txt,
+        joined by CONCAT_SEPARATOR. Inputs added since the last save are appended, unless overwrite is set.
         """
 
-        dir = self.out / "test_cases"
-        if dir.exists():
-            shutil.rmtree(dir)
-        dir.mkdir(parents=True, exist_ok=True)
-        
-        filepath_failing = os.path.join(dir, "failing_tests.json")
-        filepath_passing = os.path.join(dir, "passing_tests.json")
+        dir = self._prepare_saving_path(overwrite)
+        for filename, tests, start in (
+            ("passing.txt", self.passing, self._persisted_passing),
+            ("failing.txt", self.failing, self._persisted_failing),
+        ):
+            if start == len(tests):
+                continue
+            data = CONCAT_SEPARATOR.join(_DASH_LINE.sub(r"-\1", str(test)) for test in tests[start:])
+            if start:
+                data = CONCAT_SEPARATOR + data
+            with open(dir / filename, "ab") as f:
+                f.write(data.encode())
 
-        failing_data = {
-            "length": len(self.failing),
-            "inputs": [str(input) for input in self.failing]      
-        }
+        self._persisted_passing = len(self.passing)
+        self._persisted_failing = len(self.failing)
 
-        passing_data = {
-            "length": len(self.passing),
-            "inputs": [str(input) for input in self.passing]
-        }
 
-        with open(filepath_failing, 'w') as f:
-            json.dump(failing_data, f)
+    @staticmethod
+    def _dump_inputs(filepath: os.PathLike, inputs: List[Any]):
+        """
+        Writes {"length": ..., "inputs": [...]} to filepath, streaming one input at a time
+        through a large write buffer instead of materializing the list of strings.
+        """
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.write(b'{"length": %d, "inputs": [' % len(inputs))
+            for idx, inp in enumerate(inputs):
+                if idx:
+                    f.write(b", ")
+                f.write(_dumps(str(inp)))
+            f.write(b"]}")
+
+    def _save_as_json(self, overwrite: bool = False):
+        """
+        Saves inputs in json files.
+        """
+
+        dir = self._prepare_saving_path(overwrite)
         
-        with open(filepath_passing, 'w') as f:
-            json.dump(passing_data, f)
+        self._dump_inputs(dir / "failing_tests.json", self.failing)
+        self._dump_inputs(dir / "passing_tests.json", self.passing)
+
+        self._persisted_passing = len(self.passing)
+        self._persisted_failing = len(self.failing)
 
 
-    def save_test_cases(self, path: os.PathLike):
+    def save_test_cases(self, path: os.PathLike, use_archive: bool = False):
+        """
+        Saves self.passing and self.failing under the given path as passing_test_X and failing_test_X.
+        :param os.PathLike path: The directory to save the test cases in.
+        :param bool use_archive: If true, the test cases are written as members of a single path / "tests.tar"
+        instead of separate files.
+        """
 
         dir = Path(path)
         dir.mkdir(parents=True, exist_ok=True)
 
-        for idx, test in enumerate(self.passing):
-            passing_file_path = dir / f"passing_test_{idx}"
-            with passing_file_path.open("w") as f:
-                f.write(str(test))
+        if use_archive:
+            self._archive_inputs(dir / "tests.tar", "w")
+            LOGGER.info(f"Saved {len(self.failing) + len(self.passing)} test cases under {dir}")
+            return
 
-        for idx, test in enumerate(self.failing):
-            failing_file_path = dir / f"failing_test_{idx}"
-            with failing_file_path.open("w") as f:
-                f.write(str(test))
+        _write_files(
+            [(dir / f"passing_test_{idx}", str(test)) for idx, test in enumerate(self.passing)]
+            + [(dir / f"failing_test_{idx}", str(test)) for idx, test in enumerate(self.failing)]
+        )
 
-        LOGGER.info(f"Saved {len(self.failing) + len(self.passing)} test cases under {self.out}")
+        LOGGER.info(f"Saved {len(self.failing) + len(self.passing)} test cases under {dir}")
 
     @staticmethod
     def load_failing_tests(path: os.PathLike) -> List[str]:
@@ -137,12 +502,10 @@ class TestGenerator(ABC):
         Retrieves failing tests from specified directory.
         Only works with json saving method.
         """
-        filepath_failing = os.path.join(Path(path), "failing_tests.json")
+        filepath_failing = Path(path) / "failing_tests.json"
 
-        if os.path.exists(filepath_failing):
-            with open(filepath_failing, 'r') as f:
-                failing_data = json.load(f)
-                return failing_data.get("inputs", [])
+        if filepath_failing.is_file():
+            return _loads(filepath_failing.read_bytes()).get("inputs", [])
         else:
             return []
     
@@ -152,67 +515,109 @@ class TestGenerator(ABC):
         Retrieves passing tests from specified directory.
         Only works with json saving method.
         """
-        filepath_passing = os.path.join(Path(path), "passing_tests.json")
+        filepath_passing = Path(path) / "passing_tests.json"
 
-        if os.path.exists(filepath_passing):
-            with open(filepath_passing, 'r') as f:
-                passing_data = json.load(f)
-                return passing_data.get("inputs", [])
+        if filepath_passing.is_file():
+            return _loads(filepath_passing.read_bytes()).get("inputs", [])
         else:
             return []
     
 
     @staticmethod
-    def load_failing_test_paths(path: os.PathLike) -> List[os.PathLike]:
+    def _load_test_paths(path: os.PathLike, prefix: str, num_tests: Optional[int]) -> List[os.PathLike]:
+        filepath = Path(path)
+        if not filepath.exists():
+            return []
+
+        if num_tests is None:
+            name_prefix = f"{prefix}_test_"
+            with os.scandir(os.path.abspath(filepath)) as entries:
+                return [entry.path for entry in entries if entry.name.startswith(name_prefix)]
+        return [
+            os.path.abspath(file)
+            for file in (filepath / f"{prefix}_test_{i}" for i in range(num_tests))
+            if file.is_file()
+        ]
+
+    @staticmethod
+    def load_failing_test_paths(path: os.PathLike, num_tests: Optional[int] = None) -> List[os.PathLike]:
         """
         Retrieves failing test paths from specified directory.
+        If num_tests is given, only the first num_tests failing tests are retrieved.
         Only works with text files saving method.
         """
-        filepath = Path(path)
+        return TestGenerator._load_test_paths(path, "failing", num_tests)
 
-        if filepath.exists():
-            return [os.path.abspath(file) for file in filepath.glob("failing_test_*")]
-        else:
-            return []
-        
     @staticmethod
-    def load_failing_test_paths(path: os.PathLike, num_tests: int) -> List[os.PathLike]:
+    def load_passing_test_paths(path: os.PathLike, num_tests: Optional[int] = None) -> List[os.PathLike]:
         """
-        Retrieves first X number of failing test paths from specified directory.
+        Retrieves passing test paths from specified directory.
+        If num_tests is given, only the first num_tests passing tests are retrieved.
         Only works with text files saving method.
         """
-        filepath = Path(path)
+        return TestGenerator._load_test_paths(path, "passing", num_tests)
 
-        if filepath.exists():
-            return [os.path.abspath(os.path.join(path, f"failing_test_{i}")) 
-            for i in range(num_tests)]
-        else:
+    @staticmethod
+    def _load_from_files(path: os.PathLike, prefix: str) -> List[str]:
+        tests = {}
+        for file in TestGenerator._load_test_paths(path, prefix, None):
+            idx = file.rpartition("_")[2]
+            if idx.isdigit():
+                tests[int(idx)] = Path(file).read_bytes().decode()
+        return [tests[idx] for idx in sorted(tests)]
+
+    @staticmethod
+    def _load_from_archive(path: os.PathLike, prefix: str) -> List[str]:
+        filepath = Path(path) / "tests.tar"
+        if not filepath.is_file():
             return []
-        
+
+        tests = {}
+        with tarfile.open(filepath, "r") as tf:
+            for member in tf:
+                name, _, idx = member.name.rpartition("_")
+                if name == f"{prefix}_test" and idx.isdigit():
+                    tests[int(idx)] = tf.extractfile(member).read().decode()
+        return [tests[idx] for idx in sorted(tests)]
 
     @staticmethod
-    def load_passing_test_paths(path: os.PathLike) -> List[os.PathLike]:
+    def load_failing_tests_from_archive(path: os.PathLike) -> List[str]:
         """
-        Retrieves passing test paths from specified directory.
-        Only works with text files saving method.
+        Retrieves failing tests from the tests.tar archive in the specified directory.
+        Only works with archive saving method.
         """
-        filepath = Path(path)
+        return TestGenerator._load_from_archive(path, "failing")
 
-        if filepath.exists():
-            return [os.path.abspath(file) for file in filepath.glob("passing_test_*")]
-        else:
+    @staticmethod
+    def load_passing_tests_from_archive(path: os.PathLike) -> List[str]:
+        """
+        Retrieves passing tests from the tests.tar archive in the specified directory.
+        Only works with archive saving method.
+        """
+        return TestGenerator._load_from_archive(path, "passing")
+
+    @staticmethod
+    def _load_from_concat(path: os.PathLike, filename: str) -> List[str]:
+        filepath = Path(path) / filename
+        if not filepath.is_file():
             return []
-        
+
+        # An existing file holds at least one input, an empty file is a single empty input.
+        data = filepath.read_bytes().decode()
+        return [_ESCAPED_DASH_LINE.sub(r"\1", test) for test in data.split(CONCAT_SEPARATOR)]
+
     @staticmethod
-    def load_passing_test_paths(path: os.PathLike, num_tests: int) -> List[os.PathLike]:
+    def load_failing_tests_from_concat(path: os.PathLike) -> List[str]:
         """
-        Retrieves first X number of passing test paths from specified directory.
-        Only works with text files saving method.
+        Retrieves failing tests from the failing.txt file in the specified directory.
+        Only works with concat saving method.
         """
-        filepath = Path(path)
+        return TestGenerator._load_from_concat(path, "failing.txt")
 
-        if filepath.exists():
-            return [os.path.abspath(os.path.join(path, f"passing_test_{i}")) 
-            for i in range(num_tests)]
-        else:
-            return []
\ No newline at end of file
+    @staticmethod
+    def load_passing_tests_from_concat(path: os.PathLike) -> List[str]:
+        """
+        Retrieves passing tests from the passing.txt file in the specified directory.
+        Only works with concat saving method.
+        """
+        return TestGenerator._load_from_concat(path, "passing.txt")
@@ -1,8 +1,13 @@
 import ast
+import functools
 import os
 import random
+import tempfile
 import unittest
+from collections import ChainMap
 from pathlib import Path
+from types import MappingProxyType
+from typing import List
 
 from fixkit.candidate import GeneticCandidate
 from fixkit.genetic.crossover import OnePointCrossover
@@ -18,10 +23,25 @@ from fixkit.genetic.operators import (
     Mutator,
     InsertBoth,
     MoveBoth,
+    MutationOperator,
 )
 from fixkit.stmt import StatementFinder
 
 
+@functools.lru_cache(maxsize=1)
+def _build_fixture(source: str):
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as fp:
+        fp.write(source)
+    file = Path(fp.name)
+    finder = StatementFinder(file)
+    finder.search_source()
+    candidate = GeneticCandidate.from_candidate(finder.build_candidate())
+    finder.statements[2] = ast.Assign(
+        targets=[ast.Name(id="z")], value=ast.Num(n=3), lineno=3
+    )
+    return file, finder, candidate, MappingProxyType(finder.statements)
+
+
 class TestGenetic(unittest.TestCase):
     file = None
     finder = None
@@ -30,24 +50,23 @@ class TestGenetic(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.file = Path("test.py")
-        with cls.file.open("w") as fp:
-            fp.write("x = 1\ny = 2")
-        cls.finder = StatementFinder(cls.file)
-        cls.finder.search_source()
-        cls.candidate = GeneticCandidate.from_candidate(cls.finder.build_candidate())
-        cls.statements = cls.finder.statements
-        cls.statements[2] = ast.Assign(
-            targets=[ast.Name(id="z")], value=ast.Num(n=3), lineno=3
+        cls.file, cls.finder, cls.candidate, cls.statements = _build_fixture(
+            "x = 1\ny = 2"
         )
         cls.tree = cls.candidate.trees["."]
 
     @classmethod
     def tearDownClass(cls):
-        os.remove(cls.file)
+        try:
+            os.remove(cls.file)
+        except FileNotFoundError:
+            pass
 
 
 class TestMutations(TestGenetic):
+    def tearDown(self):
+        self.assertEqual([0, 1, 2], sorted(self.statements))
+
     def verify_assign(self, node: ast.AST, var: str, val: int):
         self.assertIsInstance(node, ast.Assign)
         self.assertEqual(1, len(node.targets))
@@ -57,19 +76,18 @@ class TestMutations(TestGenetic):
         self.assertIsInstance(node.value, ast.Constant)
         self.assertEqual(val, node.value.value)
 
+    def mutate(self, mutations: List[MutationOperator]) -> ast.AST:
+        return Mutator(ChainMap({}, self.statements), mutations).mutate(self.tree)
+
     def test_delete(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(stmts, [Delete(0, [2])])
-        tree = mutator.mutate(self.tree)
+        tree = self.mutate([Delete(0, [2])])
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.assertIsInstance(tree.body[0], ast.Pass)
         self.verify_assign(tree.body[1], "y", 2)
 
     def test_insert_before(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(stmts, [InsertBefore(0, [2])])
-        tree = mutator.mutate(self.tree)
+        tree = self.mutate([InsertBefore(0, [2])])
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.assertIsInstance(tree.body[0], ast.Module)
@@ -80,9 +98,7 @@ class TestMutations(TestGenetic):
         self.verify_assign(tree.body[1], "y", 2)
 
     def test_insert_after(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(stmts, [InsertAfter(0, [2])])
-        tree = mutator.mutate(self.tree)
+        tree = self.mutate([InsertAfter(0, [2])])
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.assertIsInstance(tree.body[0], ast.Module)
@@ -93,18 +109,14 @@ class TestMutations(TestGenetic):
         self.verify_assign(tree.body[1], "y", 2)
 
     def test_replace(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(stmts, [Replace(0, [2])])
-        tree = mutator.mutate(self.tree)
+        tree = self.mutate([Replace(0, [2])])
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.verify_assign(tree.body[0], "z", 3)
         self.verify_assign(tree.body[1], "y", 2)
 
     def test_move_before(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(stmts, [MoveBefore(1, [0])])
-        tree = mutator.mutate(self.tree)
+        tree = self.mutate([MoveBefore(1, [0])])
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.assertIsInstance(tree.body[0], ast.Pass)
@@ -115,9 +127,7 @@ class TestMutations(TestGenetic):
         self.verify_assign(module.body[1], "y", 2)
 
     def test_move_after(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(stmts, [MoveAfter(0, [1])])
-        tree = mutator.mutate(self.tree)
+        tree = self.mutate([MoveAfter(0, [1])])
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.assertIsInstance(tree.body[0], ast.Module)
@@ -128,18 +138,14 @@ class TestMutations(TestGenetic):
         self.assertIsInstance(tree.body[1], ast.Pass)
 
     def test_swap(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(stmts, [Swap(0, [1])])
-        tree = mutator.mutate(self.tree)
+        tree = self.mutate([Swap(0, [1])])
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.verify_assign(tree.body[0], "y", 2)
         self.verify_assign(tree.body[1], "x", 1)
 
     def test_copy(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(stmts, [Copy(0, [])])
-        tree = mutator.mutate(self.tree)
+        tree = self.mutate([Copy(0, [])])
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.assertIsInstance(tree.body[0], ast.Module)
@@ -150,9 +156,7 @@ class TestMutations(TestGenetic):
         self.verify_assign(tree.body[1], "y", 2)
 
     def test_multiple_mutations(self):
-        stmts = dict(self.statements)
-        mutator = Mutator(
-            stmts,
+        tree = self.mutate(
             [
                 Delete(0, []),
                 Replace(0, [2]),
@@ -162,7 +166,6 @@ class TestMutations(TestGenetic):
                 InsertAfter(1, [2]),
             ],
         )
-        tree = mutator.mutate(self.tree)
         self.assertIsInstance(tree, ast.Module)
         self.assertEqual(2, len(tree.body))
         self.assertIsInstance(tree.body[0], ast.Module)
@@ -0,0 +1,96 @@
+import unittest
+
+from fixkit.localization.location import WeightedIdentifier
+from fixkit.localization.modifier import (
+    DefaultModifier,
+    SigmoidModifier,
+    TopEqualRankModifier,
+    TopRankModifier,
+)
+
+
+class TestModifier(unittest.TestCase):
+    def setUp(self):
+        self.suggestions = [
+            WeightedIdentifier(0, 1.0),
+            WeightedIdentifier(1, 0.9),
+            WeightedIdentifier(2, 0.9),
+            WeightedIdentifier(3, 0.5),
+            WeightedIdentifier(4, 0.2),
+            WeightedIdentifier(5, 0.0),
+        ]
+
+    def test_default_modifier(self):
+        modifier = DefaultModifier()
+        locations = modifier.locations(self.suggestions)
+        self.assertEqual(self.suggestions, locations)
+        self.assertIsNot(self.suggestions, locations)
+        self.assertEqual(0.9, modifier.mutation_chance(locations[1]))
+
+    def test_top_rank_modifier(self):
+        modifier = TopRankModifier(top_k=2)
+        locations = modifier.locations(self.suggestions)
+        self.assertEqual([0, 1], [location.identifier for location in locations])
+        self.assertEqual(1.0, modifier.mutation_chance(locations[1]))
+
+    def test_top_equal_rank_modifier(self):
+        modifier = TopEqualRankModifier(top_k=2)
+        locations = modifier.locations(self.suggestions)
+        self.assertEqual([0, 1, 2], [location.identifier for location in locations])
+        self.assertEqual(1.0, modifier.mutation_chance(locations[2]))
+
+    def test_top_equal_rank_modifier_duplicate_weights(self):
+        suggestions = [
+            WeightedIdentifier(0, 0.9),
+            WeightedIdentifier(1, 0.9),
+            WeightedIdentifier(2, 0.9),
+            WeightedIdentifier(3, 0.7),
+            WeightedIdentifier(4, 0.5),
+            WeightedIdentifier(5, 0.7),
+        ]
+        modifier = TopEqualRankModifier(top_k=2)
+        locations = modifier.locations(suggestions)
+        self.assertEqual(
+            [0, 1, 2, 3, 5], [location.identifier for location in locations]
+        )
+        modifier = TopEqualRankModifier(top_k=5)
+        locations = modifier.locations(suggestions)
+        self.assertEqual(6, len(locations))
+
+    def test_top_equal_rank_modifier_threshold(self):
+        modifier = TopEqualRankModifier(top_k=10, threshold=0.3)
+        locations = modifier.locations(self.suggestions)
+        self.assertEqual(
+            [0, 1, 2, 3], [location.identifier for location in locations]
+        )
+
+    def test_sigmoid_modifier(self):
+        modifier = SigmoidModifier(steepness=10, midpoint=0.8)
+        locations = modifier.locations(self.suggestions)
+        self.assertEqual(
+            [0, 1, 2, 3, 4, 5], [location.identifier for location in locations]
+        )
+        weights = [location.weight for location in locations]
+        self.assertAlmostEqual(1.0, weights[0], delta=0.000001)
+        self.assertAlmostEqual(0.0, weights[5], delta=0.000001)
+        self.assertAlmostEqual(0.5, SigmoidModifier(midpoint=0.5).locations(
+            [WeightedIdentifier(0, 0.5)]
+        )[0].weight, delta=0.000001)
+        self.assertGreater(weights[1], 0.9)
+        self.assertLess(weights[3], 0.5)
+        self.assertEqual(weights[1], weights[2])
+        for weight in weights:
+            self.assertIsInstance(weight, float)
+
+    def test_sigmoid_modifier_bounds(self):
+        modifier = SigmoidModifier(steepness=10, midpoint=0.8)
+        locations = modifier.locations(
+            [WeightedIdentifier(0, 1.0), WeightedIdentifier(1, 0.0)]
+        )
+        self.assertEqual(1.0, locations[0].weight)
+        self.assertEqual(0.0, locations[1].weight)
+
+    def test_sigmoid_modifier_invalid_midpoint(self):
+        for midpoint in (0, 1, -0.5, 1.5):
+            with self.assertRaises(ValueError):
+                SigmoidModifier(midpoint=midpoint)
@@ -0,0 +1,322 @@
+import random
+import tempfile
+import unittest
+from enum import Enum
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from fixkit.test_generation.test_generator import (
+    TestGenerator,
+    _InputIndex,
+    _OracleCache,
+    _seeded,
+)
+
+SAVING_METHODS = ("json", "files", "archive", "concat")
+
+
+class Result(Enum):
+    PASSING = "PASSING"
+    FAILING = "FAILING"
+
+
+class ListTestGenerator(TestGenerator):
+    """
+    Labels a fixed list of inputs, inputs starting with "f" are failing.
+    """
+
+    __test__ = False
+
+    def __init__(self, inputs: List[str], **kwargs):
+        super().__init__(**kwargs)
+        self.inputs = inputs
+        self.oracle_calls = []
+        if self.cache_oracle:
+            self.oracle_cache = _OracleCache(self.out / "oracle_cache.json", Result)
+
+    def oracle(self, inp: str):
+        self.oracle_calls.append(inp)
+        return (Result.FAILING if inp.startswith("f") else Result.PASSING), None
+
+    def run(self):
+        passing, failing = [], []
+        for inp in self.inputs:
+            if self.input_index is not None:
+                if inp in self.input_index:
+                    continue
+                self.input_index.add(inp)
+            if self._label(inp) == Result.FAILING:
+                failing.append(inp)
+            else:
+                passing.append(inp)
+        self._store_session_inputs(passing, failing)
+
+
+class ReportTestGenerator(ListTestGenerator):
+    """
+    Stores all inputs like AvicennaTestGenerator.run, without consulting the input index.
+    """
+
+    __test__ = False
+
+    def run(self):
+        passing, failing = [], []
+        for inp in self.inputs:
+            if self._label(inp) == Result.FAILING:
+                failing.append(inp)
+            else:
+                passing.append(inp)
+        self._store_session_inputs(passing, failing)
+
+
+class RandomTestGenerator(TestGenerator):
+    """
+    Draws from the global random and numpy.random modules, like the fuzzers and solvers.
+    """
+
+    __test__ = False
+
+    def run(self):
+        pass
+
+    @_seeded
+    def draw(self, fail: bool = False):
+        draws = [random.random() for _ in range(3)], np.random.random(3).tolist()
+        if fail:
+            raise RuntimeError()
+        return draws
+
+
+class TestTestGenerator(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.out = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def generator(self, inputs: List[str], **kwargs) -> ListTestGenerator:
+        return ListTestGenerator(inputs, out=self.out, **kwargs)
+
+    def load(self, saving_method: str, path: Path):
+        if saving_method == "json":
+            return (
+                TestGenerator.load_passing_tests(path),
+                TestGenerator.load_failing_tests(path),
+            )
+        if saving_method == "archive":
+            return (
+                TestGenerator.load_passing_tests_from_archive(path),
+                TestGenerator.load_failing_tests_from_archive(path),
+            )
+        if saving_method == "concat":
+            return (
+                TestGenerator.load_passing_tests_from_concat(path),
+                TestGenerator.load_failing_tests_from_concat(path),
+            )
+        return tuple(
+            [
+                Path(path, f"{prefix}_test_{idx}").read_text()
+                for idx in range(
+                    len(TestGenerator._load_test_paths(path, prefix, None))
+                )
+            ]
+            for prefix in ("passing", "failing")
+        )
+
+    def test_load_test_paths(self):
+        generator = self.generator(["a", "b", "c", "f1"])
+        generator.run()
+        path = generator.saving_path
+        self.assertEqual(3, len(TestGenerator.load_passing_test_paths(path)))
+        self.assertEqual(1, len(TestGenerator.load_failing_test_paths(path)))
+        self.assertEqual(
+            [str(path / "passing_test_0"), str(path / "passing_test_1")],
+            TestGenerator.load_passing_test_paths(path, num_tests=2),
+        )
+        self.assertEqual(
+            1, len(TestGenerator.load_failing_test_paths(path, num_tests=5))
+        )
+        self.assertEqual(
+            [], TestGenerator.load_passing_test_paths(self.out / "missing")
+        )
+
+    def test_invalid_saving_method(self):
+        with self.assertRaises(ValueError):
+            self.generator([], saving_method="xml")
+
+    def test_archive_round_trip(self):
+        generator = self.generator(["a", "f1", "", "f2\n"], saving_method="archive")
+        generator.run()
+        path = generator.saving_path
+        self.assertEqual(
+            ["a", ""], TestGenerator.load_passing_tests_from_archive(path)
+        )
+        self.assertEqual(
+            ["f1", "f2\n"], TestGenerator.load_failing_tests_from_archive(path)
+        )
+
+    def test_save_test_cases(self):
+        generator = self.generator(["a", "f1", "b"], save_automatically=False)
+        generator.run()
+
+        generator.save_test_cases(self.out / "archived", use_archive=True)
+        self.assertEqual(
+            ["a", "b"],
+            TestGenerator.load_passing_tests_from_archive(self.out / "archived"),
+        )
+        self.assertEqual(
+            ["f1"],
+            TestGenerator.load_failing_tests_from_archive(self.out / "archived"),
+        )
+
+        generator.save_test_cases(self.out / "files")
+        self.assertEqual(
+            "b", Path(self.out, "files", "passing_test_1").read_text()
+        )
+        self.assertEqual(
+            "f1", Path(self.out, "files", "failing_test_0").read_text()
+        )
+
+    def test_incremental_append_after_overwrite(self):
+        for saving_method in SAVING_METHODS:
+            with self.subTest(saving_method=saving_method):
+                generator = self.generator(
+                    ["a", "b", "c", "f1"], saving_method=saving_method
+                )
+                generator.run()
+                generator.passing = ["d"]
+                generator.failing = []
+                generator._save_inputs(overwrite=True)
+                generator.passing.append("e")
+                generator.failing.append("f2")
+                generator._save_inputs()
+                self.assertEqual(
+                    (["d", "e"], ["f2"]),
+                    self.load(saving_method, generator.saving_path),
+                )
+
+    def test_oracle_cache_persists(self):
+        generator = self.generator(["a", "f1"], cache_oracle=True)
+        generator.run()
+        self.assertEqual(["a", "f1"], generator.oracle_calls)
+
+        generator = self.generator(["a", "f1", "b"], cache_oracle=True)
+        generator.run()
+        self.assertEqual(["b"], generator.oracle_calls)
+        self.assertEqual(["a", "b"], generator.passing)
+        self.assertEqual(["f1"], generator.failing)
+
+    def test_oracle_labels_memoized(self):
+        generator = self.generator(["a", "a", "f1"])
+        generator.run()
+        self.assertEqual(["a", "f1"], generator.oracle_calls)
+
+    def test_input_index_persists(self):
+        index = _InputIndex(self.out / "index.bin")
+        index.add("a")
+        index.add("b")
+        self.assertIn("a", index)
+        index.flush()
+        index = _InputIndex(self.out / "index.bin")
+        self.assertIn("a", index)
+        self.assertIn("b", index)
+        self.assertNotIn("c", index)
+
+    def test_skip_known_inputs_keeps_saved_tests(self):
+        for saving_method in SAVING_METHODS:
+            with self.subTest(saving_method=saving_method):
+                out = self.out / saving_method
+                ListTestGenerator(
+                    ["a", "f1"],
+                    out=out,
+                    saving_method=saving_method,
+                    skip_known_inputs=True,
+                ).run()
+                generator = ListTestGenerator(
+                    ["a", "f1", "b"],
+                    out=out,
+                    saving_method=saving_method,
+                    skip_known_inputs=True,
+                )
+                generator.run()
+                self.assertEqual(["b"], generator.oracle_calls)
+                self.assertEqual(
+                    (["a", "b"], ["f1"]),
+                    self.load(saving_method, generator.saving_path),
+                )
+
+    def test_skip_known_inputs_records_stored_inputs(self):
+        ReportTestGenerator(["a", "f1"], out=self.out, skip_known_inputs=True).run()
+        generator = ListTestGenerator(
+            ["a", "f1", "b"], out=self.out, skip_known_inputs=True
+        )
+        self.assertIn("a", generator.input_index)
+        self.assertIn("f1", generator.input_index)
+        generator.run()
+        self.assertEqual(["b"], generator.oracle_calls)
+        self.assertEqual(
+            (["a", "b"], ["f1"]), self.load("files", generator.saving_path)
+        )
+
+    def test_concat_round_trip(self):
+        for passing in (
+            [""],
+            ["", ""],
+            ["a\n---\nb", "---", "a\n---", "---\nb", "----", "x\n-----\ny\n"],
+        ):
+            with self.subTest(passing=passing):
+                generator = self.generator(passing, saving_method="concat")
+                generator.run()
+                path = generator.saving_path
+                self.assertEqual(
+                    passing, TestGenerator.load_passing_tests_from_concat(path)
+                )
+                self.assertEqual(
+                    [], TestGenerator.load_failing_tests_from_concat(path)
+                )
+
+
+class TestSeeding(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.out = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def generator(self, seed: int) -> RandomTestGenerator:
+        return RandomTestGenerator(seed=seed, out=self.out)
+
+    def test_global_state_restored(self):
+        random.seed(42)
+        np.random.seed(42)
+        expected = random.random(), np.random.random()
+        random.seed(42)
+        np.random.seed(42)
+        generator = self.generator(0)
+        generator.draw()
+        with self.assertRaises(RuntimeError):
+            generator.draw(fail=True)
+        self.assertEqual(expected, (random.random(), np.random.random()))
+
+    def test_same_seed_same_draws(self):
+        self.assertEqual(self.generator(0).draw(), self.generator(0).draw())
+        self.assertNotEqual(self.generator(0).draw(), self.generator(1).draw())
+
+    def test_state_continues_between_calls(self):
+        generator = self.generator(0)
+        first, second = generator.draw(), generator.draw()
+        self.assertNotEqual(first, second)
+
+        reference = random.Random(0)
+        reference_np = np.random.RandomState(0)
+        self.assertEqual(
+            (
+                [reference.random() for _ in range(6)],
+                reference_np.random(6).tolist(),
+            ),
+            (first[0] + second[0], first[1] + second[1]),
+        )